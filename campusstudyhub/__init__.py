@@ -15,7 +15,6 @@ __all__ = [
     "gui_bibtex",
     "gui_monitor",
     "gui_research",
-    "gui_lan",
     "gui_tools",
     "lan",
 ]
@@ -2,17 +2,27 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict, field
+import os
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 from .models import LanTarget
 
+try:  # optional fast JSON backend
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 DATA_DIR = Path("data")
 CONFIG_PATH = DATA_DIR / "config.json"
 
+# (st_mtime_ns, config) of the last load/save; see load_config.
+_CACHE: Optional[Tuple[int, "AppConfig"]] = None
+
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Represents persisted configuration for the application."""
 
@@ -59,17 +69,29 @@ def ensure_data_dir() -> None:
 
 
 def load_config() -> AppConfig:
-    """Load configuration from disk or create defaults."""
+    """Load configuration from disk or create defaults.
+
+    The parsed config is memoized on the file's mtime. Each call returns its
+    own copy, so in-place edits by one caller are not seen by other callers
+    or by later loads until they are saved.
+    """
+    global _CACHE
     ensure_data_dir()
-    if not CONFIG_PATH.exists():
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         cfg = AppConfig.default()
         save_config(cfg)
         return cfg
 
+    if _CACHE is not None and _CACHE[0] == mtime:
+        return _copy_config(_CACHE[1])
+
     try:
-        with CONFIG_PATH.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
-        return _config_from_dict(raw)
+        raw = _loads(CONFIG_PATH.read_bytes())
+        cfg = _config_from_dict(raw)
+        _CACHE = (mtime, _copy_config(cfg))
+        return cfg
     except Exception:
         # On error, fall back to defaults but do not overwrite existing file.
         return AppConfig.default()
@@ -77,11 +99,67 @@ def load_config() -> AppConfig:
 
 def save_config(config: AppConfig) -> None:
     """Persist configuration to disk."""
+    global _CACHE
     ensure_data_dir()
-    config.base_directory = _normalize_base_directory(config.base_directory)
-    serializable = asdict(config)
-    with CONFIG_PATH.open("w", encoding="utf-8") as f:
-        json.dump(serializable, f, indent=2)
+    normalized = _normalize_base_directory(config.base_directory)
+    if normalized != config.base_directory:
+        config.base_directory = normalized
+    serializable = _to_dict(config)
+    _CACHE = None
+    # One write to a sibling file, then an atomic rename over the real one.
+    tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+    tmp_path.write_bytes(_dumps(serializable))
+    os.replace(tmp_path, CONFIG_PATH)
+    _CACHE = (CONFIG_PATH.stat().st_mtime_ns, _copy_config(config))
+
+
+def _copy_config(config: AppConfig) -> AppConfig:
+    """Copy a config deeply enough that editing one copy never changes another."""
+
+    return replace(
+        config,
+        courses=list(config.courses),
+        lan_targets=[replace(t) for t in config.lan_targets],
+        conference_sources=list(config.conference_sources),
+    )
+
+
+def _loads(data: bytes) -> dict:
+    """Decode config JSON, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: dict) -> bytes:
+    """Encode config JSON with two-space indentation."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _to_dict(config: AppConfig) -> dict:
+    """Serialize AppConfig to plain JSON-compatible data without ``asdict``."""
+
+    return {
+        "base_directory": config.base_directory,
+        "courses": list(config.courses),
+        "upcoming_window_days": config.upcoming_window_days,
+        "conference_window_days": config.conference_window_days,
+        "lan_targets": [
+            {"label": t.label, "host": t.host, "port": t.port, "email": t.email}
+            for t in config.lan_targets
+        ],
+        "smtp_host": config.smtp_host,
+        "smtp_port": config.smtp_port,
+        "smtp_sender": config.smtp_sender,
+        "smtp_username": config.smtp_username,
+        "smtp_password": config.smtp_password,
+        "smtp_use_tls": config.smtp_use_tls,
+        "conference_sources": list(config.conference_sources),
+    }
 
 
 def _config_from_dict(raw: dict) -> AppConfig:
@@ -95,24 +173,36 @@ def _config_from_dict(raw: dict) -> AppConfig:
         except TypeError:
             continue
 
+    defaults = _defaults()
     return AppConfig(
         base_directory=_normalize_base_directory(
-            raw.get("base_directory", AppConfig.default().base_directory)
+            raw.get("base_directory", defaults.base_directory)
         ),
-        courses=raw.get("courses", AppConfig.default().courses),
+        courses=raw.get("courses", list(defaults.courses)),
         upcoming_window_days=raw.get("upcoming_window_days", 7),
         conference_window_days=raw.get("conference_window_days", 30),
-        lan_targets=lan_targets or AppConfig.default().lan_targets,
+        lan_targets=lan_targets or [replace(t) for t in defaults.lan_targets],
         smtp_host=raw.get("smtp_host", "localhost"),
         smtp_port=raw.get("smtp_port", 25),
         smtp_sender=raw.get("smtp_sender", "campusstudyhub@example.com"),
         smtp_username=raw.get("smtp_username", ""),
         smtp_password=raw.get("smtp_password", ""),
         smtp_use_tls=raw.get("smtp_use_tls", False),
-        conference_sources=raw.get("conference_sources", AppConfig.default().conference_sources),
+        conference_sources=raw.get("conference_sources", list(defaults.conference_sources)),
     )
 
 
+@lru_cache(maxsize=None)
+def _defaults() -> AppConfig:
+    """Shared default config used only as a read-only source of fallbacks.
+
+    Callers that need an instance they can mutate should use
+    ``AppConfig.default()`` instead; list fields are copied before use.
+    """
+
+    return AppConfig.default()
+
+
 def _normalize_base_directory(path_str: str) -> str:
     """Return a user-expanded base directory string without requiring it to exist."""
 
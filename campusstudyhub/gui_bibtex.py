@@ -4,7 +4,12 @@ from __future__ import annotations
 import re
 import tkinter as tk
 from tkinter import messagebox
-from typing import Dict
+from typing import Optional
+
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
+_NON_ALNUM_SPACE = re.compile(r"[^a-zA-Z0-9 ]")
+_ENTRY_HEADER = re.compile(r"@[a-zA-Z]+\{[^,]+,")
+_AUTHOR_SPLIT = re.compile(r"\s*,\s*")
 
 
 class BibtexGenerator(tk.Frame):
@@ -12,6 +17,13 @@ class BibtexGenerator(tk.Frame):
 
     def __init__(self, master: tk.Misc):
         super().__init__(master)
+        # Widgets are created the first time the frame is mapped, so a tab
+        # that is never opened costs nothing at startup.
+        self._map_bind_id = self.bind("<Map>", self._lazy_build, add="+")
+        self._status_after_id: Optional[str] = None
+
+    def _lazy_build(self, _event: tk.Event) -> None:
+        self.unbind("<Map>", self._map_bind_id)
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -61,6 +73,9 @@ class BibtexGenerator(tk.Frame):
         self.output.grid(row=7, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
         self.rowconfigure(7, weight=1)
 
+        self.status = tk.Label(self, text="", fg="gray")
+        self.status.grid(row=8, column=0, columnspan=2, sticky="w", padx=5)
+
     def generate(self) -> None:
         """Create a BibTeX entry based on provided fields."""
         title = self.title_var.get().strip()
@@ -69,25 +84,21 @@ class BibtexGenerator(tk.Frame):
             messagebox.showinfo("提示", "请至少填写标题或 DOI")
             return
 
-        authors = [a.strip() for a in self.authors_var.get().split(",") if a.strip()]
+        authors = [a for a in _AUTHOR_SPLIT.split(self.authors_var.get().strip()) if a]
         year = self.year_var.get().strip() or "2024"
         venue = self.venue_var.get().strip() or "未知出版物"
         key = self._build_key(title=title, doi=doi, year=year)
 
-        entry: Dict[str, str] = {
-            "title": title or "未命名条目",
-            "author": " and ".join(authors) if authors else "佚名",
-            "year": year,
-            "journal": venue,
-        }
-        if doi:
-            entry["doi"] = doi
-
-        lines = [f"@article{{{key},"]
-        for k, v in entry.items():
-            lines.append(f"  {k} = {{{v}}},")
-        lines.append("}")
-        bib = "\n".join(lines)
+        author = " and ".join(authors) if authors else "佚名"
+        doi_line = f"  doi = {{{doi}}},\n" if doi else ""
+        bib = (
+            f"@article{{{key},\n"
+            f"  title = {{{title or '未命名条目'}}},\n"
+            f"  author = {{{author}}},\n"
+            f"  year = {{{year}}},\n"
+            f"  journal = {{{venue}}},\n"
+            f"{doi_line}}}"
+        )
         self.output.delete("1.0", tk.END)
         self.output.insert(tk.END, bib)
 
@@ -100,16 +111,10 @@ class BibtexGenerator(tk.Frame):
         if not content.startswith("@"):
             messagebox.showerror("格式错误", "必须以 @ 开头，例如 @article{...}")
             return
-        braces = 0
-        for ch in content:
-            if ch == "{":
-                braces += 1
-            elif ch == "}":
-                braces -= 1
-        if braces != 0:
+        if content.count("{") != content.count("}"):
             messagebox.showerror("格式错误", "大括号不平衡，请检查")
             return
-        if not re.search(r"@[a-zA-Z]+\{[^,]+,", content):
+        if not _ENTRY_HEADER.search(content):
             messagebox.showerror("格式错误", "缺少条目类型或 key")
             return
         messagebox.showinfo("通过", "看起来是有效的 BibTeX 结构")
@@ -120,13 +125,21 @@ class BibtexGenerator(tk.Frame):
             return
         self.clipboard_clear()
         self.clipboard_append(text)
-        messagebox.showinfo("已复制", "BibTeX 已复制到剪贴板")
+        self.status.config(text="BibTeX 已复制到剪贴板")
+        # Restart the timer so a quick second copy keeps its message for the full time.
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self._status_after_id = self.after(1500, self._clear_status)
+
+    def _clear_status(self) -> None:
+        self._status_after_id = None
+        self.status.config(text="")
 
     @staticmethod
     def _build_key(title: str, doi: str, year: str) -> str:
         if doi:
-            cleaned = re.sub(r"[^a-zA-Z0-9]", "", doi)
+            cleaned = _NON_ALNUM.sub("", doi)
             return (cleaned[:20] + year)[-24:]
-        words = [w for w in re.sub(r"[^a-zA-Z0-9 ]", "", title).split() if w]
+        words = [w for w in _NON_ALNUM_SPACE.sub("", title).split() if w]
         base = "".join(words[:3]) or "entry"
         return f"{base[:12]}{year}"
@@ -11,12 +11,19 @@ Features
 
 from __future__ import annotations
 
+import bisect
+import copy
+import queue
+import re
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, timedelta
+from functools import lru_cache
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Callable, List, Optional, Sequence, Set, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import customtkinter as ctk
 
@@ -38,6 +45,11 @@ TREEVIEW_SEL_BG = "#1f538d"
 HEADER_BG = "#3a3a3a"
 HEADER_FG = "#ffffff"
 
+REFRESH_DEBOUNCE_MS = 120
+LOAD_POLL_MS = 30
+SAVE_COALESCE_S = 0.1
+_SAVE_STOP = object()
+
 
 def _safe_str(x: object) -> str:
     return "" if x is None else str(x)
@@ -57,13 +69,45 @@ def _clamp_int(v: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, v))
 
 
+# (conf, display cells after the check column, row tags)
+_ConfRow = Tuple[ConferenceEvent, Tuple[str, ...], Tuple[str, ...]]
+
+
+def _conf_cells(c: ConferenceEvent) -> Tuple[str, ...]:
+    """Display cells for a conference row, excluding the check column."""
+    remind_days = c.remind_before_days
+    remind_txt = f"提前{remind_days}天" if isinstance(remind_days, int) else "默认"
+    return ("★" if c.starred else "☆", c.name, c.category, c.submission_deadline, remind_txt)
+
+
+@lru_cache(maxsize=256)
+def _format_lan_target(label: object, email: object) -> Tuple[str, str]:
+    """Display cells (name, email/info) for a recipient row."""
+    return (_safe_str(label), _safe_str(email))
+
+
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+
 def _parse_date_yyyy_mm_dd(date_str: str) -> str:
     """
     Validate and normalize YYYY-MM-DD.
     Returns normalized string if ok; raises ValueError otherwise.
     """
-    d = datetime.strptime(date_str.strip(), "%Y-%m-%d")
-    return d.strftime("%Y-%m-%d")
+    date_str = date_str.strip()
+    # Canonical input goes straight through the C parser; the shape check keeps
+    # out the other ISO forms (week dates, no separators) newer Pythons accept.
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str).isoformat()
+        except ValueError:
+            pass
+    m = _DATE_RE.fullmatch(date_str)
+    if not m:
+        raise ValueError(f"not a YYYY-MM-DD date: {date_str!r}")
+    y, mo, d = map(int, m.groups())
+    date(y, mo, d)  # rejects impossible calendar dates
+    return f"{y:04d}-{mo:02d}-{d:02d}"
 
 
 _STYLE_DONE = False
@@ -82,7 +126,9 @@ def setup_treeview_style_scoped() -> None:
     try:
         # clam is more customizable; may affect global theme in ttk,
         # but styling name is still scoped and won't override "Treeview".
-        style.theme_use("clam")
+        # Switching themes restyles every ttk widget, so skip it when already active.
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
     except Exception:
         pass
 
@@ -109,7 +155,7 @@ def setup_treeview_style_scoped() -> None:
     _STYLE_DONE = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LanTargetLite:
     """
     A stable recipient record.
@@ -136,6 +182,10 @@ def _ensure_target_obj(name: str, email: str) -> Any:
 # Main Frame
 # =============================================================================
 class ConferencesFrame(ctk.CTkFrame):
+    _MSG_HEADER = "会议提醒:\n"
+    _NORMAL_TAGS: Tuple[str, ...] = ()
+    _OVERDUE_TAGS: Tuple[str, ...] = ("overdue",)
+
     def __init__(
         self,
         master: tk.Widget,
@@ -146,9 +196,31 @@ class ConferencesFrame(ctk.CTkFrame):
         self.config = config
         self.on_config_update = on_config_update
 
-        # Data
-        self.conferences: List[ConferenceEvent] = load_conferences()
-        self._fav_ids: Set[str] = set()
+        # Data; filled in by _install_conferences once the background load finishes
+        self.conferences: List[ConferenceEvent] = []
+        self._conf_by_id: Dict[str, ConferenceEvent] = {}
+        self._loaded = False
+        self._save_after_load = False
+        self._edited_during_reload = False
+        self._ui_built = False
+        # (category, keyword, tab, today) -> [(conf, display cells, tags)]; cleared on mutation
+        self._filter_cache: Dict[Tuple[str, str, str, date], List[_ConfRow]] = {}
+        # Starred conferences in list order; built on first use of the 我的关注 tab
+        self._fav_confs: Optional[List[ConferenceEvent]] = None
+        # category -> conferences in list order; built on first category filter
+        self._conf_by_cat: Dict[str, List[ConferenceEvent]] = {}
+        # id -> lowercased name for keyword matching; built on first keyword search
+        self._search_index: Dict[str, str] = {}
+        # Conferences with a parseable deadline, sorted by it (keys, confs); built lazily
+        self._deadline_index: Optional[Tuple[List[date], List[ConferenceEvent]]] = None
+        # What conf_tree currently shows: ordered ids and per-id (values without check, tags).
+        # _conf_rows also keeps rows the filter detached, so they can be re-attached cheaply.
+        self._displayed_ids: List[str] = []
+        self._conf_rows: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        self._target_rows: List[Tuple[str, str]] = []
+        # Checked rows, mirrored from the check column so reads need no Tk calls
+        self._checked_conf_ids: Set[str] = set()
+        self._checked_target_idxs: Set[int] = set()
 
         # Variables
         self.keyword_var = tk.StringVar(value="")
@@ -157,20 +229,81 @@ class ConferencesFrame(ctk.CTkFrame):
         self.show_tab_var = tk.StringVar(value="all")  # "all" or "fav"
 
         # Auto-remind settings
-        self.window_days_var = tk.StringVar(value=str(getattr(self.config, "conference_window_days", 7)))
+        self.window_days_var = tk.StringVar(value=str(self.config.conference_window_days))
         self.include_overdue_var = tk.BooleanVar(value=True)
 
         self._after_id: Optional[str] = None
+        self._refresh_after_id: Optional[str] = None
+        self._load_after_id: Optional[str] = None
+        # monotonic time the next auto refresh is due
+        self._next_auto_tick = 0.0
         self._sending = False
 
+        # Worker for conference loads and reloads; shut down in destroy().
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csh-conf")
+        self._load_future = self._executor.submit(load_conferences)
+        self._load_after_id = self.after(LOAD_POLL_MS, self._poll_load)
+        # Saves run on a background writer; the queue holds at most the latest snapshot.
+        self._save_queue: "queue.Queue[Any]" = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        # Set by destroy(): the Tk thread is then blocked joining the writer.
+        self._closing = False
+        self._save_thread.start()
+
+        # Widgets, initial population and the auto-refresh timer wait until
+        # the tab is first shown.
+        self.bind("<Map>", self._lazy_build, add="+")
+
+    def _lazy_build(self, _event: tk.Event) -> None:
+        # CTkFrame.bind returns no id, so drop every <Map> binding this frame added.
+        self.unbind("<Map>")
         setup_treeview_style_scoped()
 
         self._build_ui()
-        self._rebuild_fav_set()
+        # Every filter input funnels into the same debounced refresh.
+        for var in (self.keyword_var, self.category_var):
+            var.trace_add("write", lambda *_: self._schedule_refresh())
+        self._ui_built = True
         self.refresh_targets()
         self.refresh_conference_list()
         self._schedule_auto_refresh()
 
+    def _poll_load(self) -> None:
+        # Polled from the Tk thread: the worker must not call into Tk before mainloop runs.
+        if not self._load_future.done():
+            self._load_after_id = self.after(LOAD_POLL_MS, self._poll_load)
+            return
+        self._load_after_id = None
+        try:
+            loaded = self._load_future.result()
+        except Exception as exc:
+            messagebox.showerror("错误", f"读取会议列表失败：{exc}")
+            if self._loaded:
+                # A failed reload keeps the list already on screen.
+                return
+            # Carry on with what is in memory; staying unloaded would make every
+            # later edit wait for a load that never comes, and silently drop it.
+            loaded = []
+        self._install_conferences(loaded)
+
+    def _install_conferences(self, loaded: List[ConferenceEvent]) -> None:
+        if not self._loaded:
+            # Anything added while the first load was in flight goes after the stored list.
+            self.conferences = loaded + self.conferences
+        elif self._edited_during_reload:
+            # Edits made while reloading are newer than what was read and are
+            # already queued for saving; keep the in-memory list.
+            return
+        else:
+            self.conferences = loaded
+        self._conf_by_id = {c.id: c for c in self.conferences}
+        self._loaded = True
+        self._invalidate_filter_cache()
+        if self._save_after_load:
+            self._request_save()
+        if self._ui_built:
+            self.refresh_conference_list()
+
     # -------------------------------------------------------------------------
     # UI
     # -------------------------------------------------------------------------
@@ -284,6 +417,9 @@ class ConferencesFrame(ctk.CTkFrame):
         )
         self.btn_manual_send.pack(fill="x", pady=(3, 0))
 
+        # Shown only while a send is in flight
+        self.send_progress = ctk.CTkProgressBar(send_frame, mode="indeterminate", height=6)
+
     # -------------------------------------------------------------------------
     # Right Panel (Conferences)
     # -------------------------------------------------------------------------
@@ -385,14 +521,29 @@ class ConferencesFrame(ctk.CTkFrame):
     # Targets logic
     # -------------------------------------------------------------------------
     def refresh_targets(self) -> None:
-        for i in self.targets_tree.get_children():
-            self.targets_tree.delete(i)
+        """Sync targets_tree with config.lan_targets, rewriting only changed rows.
+
+        Rows are keyed by list index; a row whose text changed is a different
+        recipient (or an edited one), so its checkbox is reset.
+        """
+        tree = self.targets_tree
+        targets = self.config.lan_targets
+        new_rows = [_format_lan_target(t.label, t.email) for t in targets]
+        old_rows = self._target_rows
+        if new_rows == old_rows:
+            return
 
-        targets = list(getattr(self.config, "lan_targets", []) or [])
-        for idx, t in enumerate(targets):
-            label = getattr(t, "label", f"User {idx}")
-            email = getattr(t, "email", "")
-            self.targets_tree.insert("", tk.END, iid=str(idx), values=(CHECK_OFF, label, email))
+        checked = self._checked_target_idxs
+        if len(old_rows) > len(new_rows):
+            tree.delete(*(str(i) for i in range(len(new_rows), len(old_rows))))
+            checked.difference_update(range(len(new_rows), len(old_rows)))
+        for idx, row in enumerate(new_rows):
+            if idx >= len(old_rows):
+                tree.insert("", tk.END, iid=str(idx), values=(CHECK_OFF,) + row)
+            elif old_rows[idx] != row:
+                tree.item(str(idx), values=(CHECK_OFF,) + row)
+                checked.discard(idx)
+        self._target_rows = new_rows
 
     def _on_targets_click(self, event: tk.Event) -> None:
         region = self.targets_tree.identify("region", event.x, event.y)
@@ -404,35 +555,31 @@ class ConferencesFrame(ctk.CTkFrame):
         item = self.targets_tree.identify_row(event.y)
         if not item:
             return
-        vals = list(self.targets_tree.item(item, "values"))
-        vals[0] = CHECK_OFF if vals[0] == CHECK_ON else CHECK_ON
-        self.targets_tree.item(item, values=vals)
+        idx = int(item)
+        checked = self._checked_target_idxs
+        if idx in checked:
+            checked.discard(idx)
+            self.targets_tree.set(item, "check", CHECK_OFF)
+        else:
+            checked.add(idx)
+            self.targets_tree.set(item, "check", CHECK_ON)
 
     def select_all_targets(self) -> None:
-        for item in self.targets_tree.get_children():
-            vals = list(self.targets_tree.item(item, "values"))
-            vals[0] = CHECK_ON
-            self.targets_tree.item(item, values=vals)
+        tree = self.targets_tree
+        for item in tree.get_children():
+            tree.set(item, "check", CHECK_ON)
+        self._checked_target_idxs = set(range(len(self._target_rows)))
 
     def invert_targets(self) -> None:
-        for item in self.targets_tree.get_children():
-            vals = list(self.targets_tree.item(item, "values"))
-            vals[0] = CHECK_OFF if vals[0] == CHECK_ON else CHECK_ON
-            self.targets_tree.item(item, values=vals)
+        tree = self.targets_tree
+        checked = set(range(len(self._target_rows))) - self._checked_target_idxs
+        for item in tree.get_children():
+            tree.set(item, "check", CHECK_ON if int(item) in checked else CHECK_OFF)
+        self._checked_target_idxs = checked
 
     def get_checked_targets(self) -> List[Any]:
-        targets = list(getattr(self.config, "lan_targets", []) or [])
-        out: List[Any] = []
-        for item in self.targets_tree.get_children():
-            vals = self.targets_tree.item(item, "values")
-            if vals and vals[0] == CHECK_ON:
-                try:
-                    idx = int(item)
-                    if 0 <= idx < len(targets):
-                        out.append(targets[idx])
-                except Exception:
-                    pass
-        return out
+        targets = self.config.lan_targets
+        return [targets[i] for i in sorted(self._checked_target_idxs) if i < len(targets)]
 
     def _get_selected_target_index(self) -> Optional[int]:
         sel = self.targets_tree.selection()
@@ -452,7 +599,7 @@ class ConferencesFrame(ctk.CTkFrame):
 
         new_t = _ensure_target_obj(name, email)
 
-        current = list(getattr(self.config, "lan_targets", []) or [])
+        current = list(self.config.lan_targets)
         current.append(new_t)
         self.config.lan_targets = current
         self.on_config_update(self.config)
@@ -463,82 +610,170 @@ class ConferencesFrame(ctk.CTkFrame):
 
     def edit_selected_target(self) -> None:
         idx = self._get_selected_target_index()
-        targets = list(getattr(self.config, "lan_targets", []) or [])
+        targets = self.config.lan_targets
         if idx is None or not (0 <= idx < len(targets)):
             messagebox.showinfo("提示", "请先在联系人列表中选择一个联系人（可双击编辑）")
             return
 
         t = targets[idx]
-        EditTargetDialog(self, t, on_save=lambda: self._on_target_modified())
+        EditTargetDialog(self, t, on_save=lambda: self._on_target_modified(idx))
 
     def delete_selected_target(self) -> None:
         idx = self._get_selected_target_index()
-        targets = list(getattr(self.config, "lan_targets", []) or [])
+        targets = self.config.lan_targets
         if idx is None or not (0 <= idx < len(targets)):
             messagebox.showinfo("提示", "请先选择一个联系人")
             return
 
         t = targets[idx]
-        label = getattr(t, "label", "该联系人")
+        label = t.label or "该联系人"
         if not messagebox.askyesno("确认删除", f"确定删除联系人：{label} ?"):
             return
 
-        targets.pop(idx)
-        self.config.lan_targets = targets
+        # Replace rather than mutate the list so readers holding it are unaffected.
+        self.config.lan_targets = targets[:idx] + targets[idx + 1:]
         self.on_config_update(self.config)
         self.refresh_targets()
 
-    def _on_target_modified(self) -> None:
+    def _on_target_modified(self, idx: int) -> None:
+        """Rewrite just the edited recipient's row; it is the same person, so keep its check."""
         self.on_config_update(self.config)
-        self.refresh_targets()
+        targets = self.config.lan_targets
+        if not (0 <= idx < len(targets) == len(self._target_rows)):
+            self.refresh_targets()
+            return
+        t = targets[idx]
+        row = _format_lan_target(t.label, t.email)
+        if row != self._target_rows[idx]:
+            check = CHECK_ON if idx in self._checked_target_idxs else CHECK_OFF
+            self.targets_tree.item(str(idx), values=(check,) + row)
+            self._target_rows[idx] = row
 
     # -------------------------------------------------------------------------
     # Conference logic
     # -------------------------------------------------------------------------
-    def _rebuild_fav_set(self) -> None:
-        self._fav_ids = {c.id for c in self.conferences if getattr(c, "favorite", False)}
-
     def _on_tab_change(self, value: str) -> None:
         self.show_tab_var.set("fav" if value == "我的关注" else "all")
         self.refresh_conference_list()
 
-    def refresh_conference_list(self) -> None:
-        self._rebuild_fav_set()
-
-        for i in self.conf_tree.get_children():
-            self.conf_tree.delete(i)
-
+    def _invalidate_filter_cache(self) -> None:
+        self._filter_cache.clear()
+        self._fav_confs = None
+        self._conf_by_cat.clear()
+        self._search_index.clear()
+        self._deadline_index = None
+
+    def _deadlines_sorted(self) -> Tuple[List[date], List[ConferenceEvent]]:
+        """Return (deadlines, confs) sorted by deadline, for bisecting date windows."""
+        if self._deadline_index is None:
+            # 日期不可解析的会议不参与自动匹配
+            dated = sorted((c.deadline_date, i, c) for i, c in enumerate(self.conferences) if c.deadline_date is not None)
+            self._deadline_index = ([d for d, _, _ in dated], [c for _, _, c in dated])
+        return self._deadline_index
+
+    def _filtered_conferences(self) -> List[_ConfRow]:
+        """Return display rows for conferences matching the current filters, memoized."""
         cat_filter = self.category_var.get()
         kw_filter = self.keyword_var.get().lower().strip()
         tab_filter = self.show_tab_var.get()
+        today = date.today()
+        key = (cat_filter, kw_filter, tab_filter, today)
+
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Narrow the scan up front: favourites are usually few, categories are bucketed.
+        all_cats = cat_filter in ("", "全部")
+        if tab_filter == "fav":
+            if self._fav_confs is None:
+                self._fav_confs = [c for c in self.conferences if c.starred]
+            source = self._fav_confs if all_cats else [c for c in self._fav_confs if c.category == cat_filter]
+        elif all_cats:
+            source = self.conferences
+        else:
+            if not self._conf_by_cat:
+                for c in self.conferences:
+                    self._conf_by_cat.setdefault(c.category, []).append(c)
+            source = self._conf_by_cat.get(cat_filter, [])
+
+        search = self._search_index
+        if kw_filter and not search:
+            search.update((c.id, c.name.lower()) for c in self.conferences)
+        # Space-separated keywords must all match; a single one stays a plain substring test.
+        tokens = kw_filter.split()
+        if not tokens:
+            matched = source
+        elif len(tokens) == 1:
+            matched = [c for c in source if kw_filter in search[c.id]]
+        else:
+            matched = [c for c in source if all(tok in search[c.id] for tok in tokens)]
+
+        overdue_tags, normal_tags = self._OVERDUE_TAGS, self._NORMAL_TAGS
+        rows: List[_ConfRow] = [
+            (c, _conf_cells(c), overdue_tags if (due := c.deadline_date) is not None and due < today else normal_tags)
+            for c in matched
+        ]
+
+        self._filter_cache[key] = rows
+        return rows
 
-        for c in self.conferences:
-            if cat_filter != "全部" and c.category != cat_filter:
-                continue
-            if tab_filter == "fav" and not getattr(c, "favorite", False):
-                continue
-            if kw_filter and kw_filter not in c.name.lower():
-                continue
-
-            fav_mark = "★" if getattr(c, "favorite", False) else "☆"
-            remind_days = getattr(c, "remind_before_days", None)
-            remind_txt = f"提前{remind_days}天" if isinstance(remind_days, int) else "默认"
-
-            tags = ()
-            try:
-                if c.is_overdue():
-                    tags = ("overdue",)
-            except Exception:
-                # 不吞掉：只是不影响渲染
-                tags = ()
-
-            self.conf_tree.insert(
-                "",
-                tk.END,
-                iid=c.id,
-                values=(CHECK_OFF, fav_mark, c.name, c.category, c.submission_deadline, remind_txt),
-                tags=tags,
-            )
+    def refresh_conference_list(self) -> None:
+        """Sync conf_tree with the filtered list, touching only rows that changed."""
+        # An immediate refresh supersedes any debounced one still pending.
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        tree = self.conf_tree
+
+        rows = self._filtered_conferences()
+        new_ids = [c.id for c, _, _ in rows]
+        new_set = set(new_ids)
+
+        old_shown = set(self._displayed_ids)
+
+        # Rows of deleted conferences go for good; rows merely filtered out are
+        # detached and keep their item (and check mark) for when they return.
+        known = self._conf_by_id
+        gone = [iid for iid in self._conf_rows if iid not in known]
+        if gone:
+            tree.delete(*gone)
+            for iid in gone:
+                del self._conf_rows[iid]
+            self._checked_conf_ids.difference_update(gone)
+        hidden = [iid for iid in self._displayed_ids if iid not in new_set and iid in known]
+        if hidden:
+            tree.selection_remove(*hidden)
+            tree.detach(*hidden)
+
+        # Surviving rows keep their relative order unless the underlying list
+        # was reordered; only then do we pay for explicit moves.
+        survivors = [iid for iid in self._displayed_ids if iid in new_set]
+        in_order = survivors == [iid for iid in new_ids if iid in old_shown]
+
+        for idx, (c, tail, tags) in enumerate(rows):
+            prev = self._conf_rows.get(c.id)
+            if prev is None:
+                tree.insert("", idx, iid=c.id, values=(CHECK_OFF,) + tail, tags=tags)
+            else:
+                if prev != (tail, tags):
+                    check = CHECK_ON if c.id in self._checked_conf_ids else CHECK_OFF
+                    tree.item(c.id, values=(check,) + tail, tags=tags)
+                if not in_order or c.id not in old_shown:
+                    tree.move(c.id, "", idx)
+            self._conf_rows[c.id] = (tail, tags)
+
+        self._displayed_ids = new_ids
+
+    def _schedule_refresh(self, delay_ms: int = REFRESH_DEBOUNCE_MS) -> None:
+        """Coalesce bursts of filter edits into a single refresh."""
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(delay_ms, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        self._refresh_after_id = None
+        self.refresh_conference_list()
 
     def _on_conf_click(self, event: tk.Event) -> None:
         region = self.conf_tree.identify("region", event.x, event.y)
@@ -551,30 +786,45 @@ class ConferencesFrame(ctk.CTkFrame):
             return
 
         if col == "#1":
-            vals = list(self.conf_tree.item(item, "values"))
-            vals[0] = CHECK_OFF if vals[0] == CHECK_ON else CHECK_ON
-            self.conf_tree.item(item, values=vals)
+            checked = self._checked_conf_ids
+            if item in checked:
+                checked.discard(item)
+                self.conf_tree.set(item, "check", CHECK_OFF)
+            else:
+                checked.add(item)
+                self.conf_tree.set(item, "check", CHECK_ON)
         elif col == "#2":
             self._toggle_fav_single(item)
 
     def _toggle_fav_single(self, conf_id: str) -> None:
-        conf = next((c for c in self.conferences if c.id == conf_id), None)
+        conf = self._conf_by_id.get(conf_id)
         if not conf:
             return
-        cur = bool(getattr(conf, "favorite", False))
-        setattr(conf, "favorite", not cur)
-        save_conferences(self.conferences)
-        self.refresh_conference_list()
+        conf.starred = not conf.starred
+        # Only the favourites-derived caches depend on the star.
+        self._filter_cache.clear()
+        self._fav_confs = None
+        self._request_save()
+
+        # Patch the one row instead of re-filtering the whole list.
+        star = "★" if conf.starred else "☆"
+        tree = self.conf_tree
+        tree.set(conf_id, "fav", star)
+        prev = self._conf_rows.get(conf_id)
+        if prev is not None:
+            tail, tags = prev
+            self._conf_rows[conf_id] = ((star,) + tail[1:], tags)
+        if self.show_tab_var.get() == "fav" and not conf.starred and conf_id in self._displayed_ids:
+            tree.selection_remove(conf_id)
+            tree.detach(conf_id)
+            self._displayed_ids.remove(conf_id)
 
     def get_checked_confs(self) -> List[ConferenceEvent]:
-        checked: List[ConferenceEvent] = []
         highlighted: List[ConferenceEvent] = []
-        map_confs = {c.id: c for c in self.conferences}
-
-        for item in self.conf_tree.get_children():
-            vals = self.conf_tree.item(item, "values")
-            if vals and vals[0] == CHECK_ON and item in map_confs:
-                checked.append(map_confs[item])
+        map_confs = self._conf_by_id
+        # Only rows the current filter shows count, in display order.
+        marks = self._checked_conf_ids
+        checked = [map_confs[i] for i in self._displayed_ids if i in marks and i in map_confs]
 
         for item in self.conf_tree.selection():
             if item in map_confs:
@@ -583,16 +833,19 @@ class ConferencesFrame(ctk.CTkFrame):
         return checked if checked else highlighted
 
     def select_all_confs(self) -> None:
-        for item in self.conf_tree.get_children():
-            vals = list(self.conf_tree.item(item, "values"))
-            vals[0] = CHECK_ON
-            self.conf_tree.item(item, values=vals)
+        tree = self.conf_tree
+        for item in tree.get_children():
+            tree.set(item, "check", CHECK_ON)
+        self._checked_conf_ids.update(self._displayed_ids)
 
     def clear_conf_selection(self) -> None:
-        for item in self.conf_tree.get_children():
-            vals = list(self.conf_tree.item(item, "values"))
-            vals[0] = CHECK_OFF
-            self.conf_tree.item(item, values=vals)
+        # Clear every check, including rows the current filter has detached, so
+        # they do not come back checked when the filter changes.
+        tree = self.conf_tree
+        for item in self._checked_conf_ids:
+            if item in self._conf_rows:
+                tree.set(item, "check", CHECK_OFF)
+        self._checked_conf_ids.clear()
         # ✅ 修复：selection_remove 需要 *items
         self.conf_tree.selection_remove(*self.conf_tree.selection())
 
@@ -604,7 +857,9 @@ class ConferencesFrame(ctk.CTkFrame):
 
     def _on_add_conf_save(self, new_conf: ConferenceEvent) -> None:
         self.conferences.append(new_conf)
-        save_conferences(self.conferences)
+        self._conf_by_id[new_conf.id] = new_conf
+        self._invalidate_filter_cache()
+        self._request_save()
         self.refresh_conference_list()
 
     def edit_selected_conf(self) -> None:
@@ -615,7 +870,8 @@ class ConferencesFrame(ctk.CTkFrame):
         EditConferenceDialog(self, targets[0], self._on_edit_save)
 
     def _on_edit_save(self) -> None:
-        save_conferences(self.conferences)
+        self._invalidate_filter_cache()
+        self._request_save()
         self.refresh_conference_list()
 
     def delete_selected_conf(self) -> None:
@@ -626,9 +882,32 @@ class ConferencesFrame(ctk.CTkFrame):
             return
 
         ids = {c.id for c in targets}
-        self.conferences = [c for c in self.conferences if c.id not in ids]
-        save_conferences(self.conferences)
-        self.refresh_conference_list()
+        self.conferences[:] = [c for c in self.conferences if c.id not in ids]
+        for conf_id in ids:
+            self._conf_by_id.pop(conf_id, None)
+        self._prune_deleted(ids)
+        self._request_save()
+
+        # The filter state is unchanged, so dropping the rows is the whole update.
+        rows = [iid for iid in ids if iid in self._conf_rows]
+        if rows:
+            self.conf_tree.delete(*rows)
+            for iid in rows:
+                del self._conf_rows[iid]
+        self._checked_conf_ids.difference_update(ids)
+        self._displayed_ids = [iid for iid in self._displayed_ids if iid not in ids]
+
+    def _prune_deleted(self, ids: Set[str]) -> None:
+        """Drop deleted conferences from the filter caches instead of rebuilding them."""
+        for key, rows in self._filter_cache.items():
+            self._filter_cache[key] = [r for r in rows if r[0].id not in ids]
+        if self._fav_confs is not None:
+            self._fav_confs = [c for c in self._fav_confs if c.id not in ids]
+        for cat, bucket in self._conf_by_cat.items():
+            self._conf_by_cat[cat] = [c for c in bucket if c.id not in ids]
+        for conf_id in ids:
+            self._search_index.pop(conf_id, None)
+        self._deadline_index = None
 
     def toggle_favorite_selected(self) -> None:
         targets = self.get_checked_confs()
@@ -636,16 +915,99 @@ class ConferencesFrame(ctk.CTkFrame):
             return
 
         # 如果选中里有人未关注 -> 全部关注；否则全部取关
-        any_not_fav = any(not bool(getattr(c, "favorite", False)) for c in targets)
+        any_not_fav = any(not c.starred for c in targets)
         for c in targets:
-            setattr(c, "favorite", True if any_not_fav else False)
+            c.starred = any_not_fav
 
-        save_conferences(self.conferences)
+        self._invalidate_filter_cache()
+        self._request_save()
         self.refresh_conference_list()
 
     def manual_refresh(self) -> None:
-        self.conferences = load_conferences()
-        self.refresh_conference_list()
+        if self._load_after_id is not None:
+            # A load is already in flight and will refresh when it lands.
+            return
+        self._edited_during_reload = False
+        self._load_future = self._executor.submit(self._reload_job)
+        self._load_after_id = self.after(LOAD_POLL_MS, self._poll_load)
+
+    def _reload_job(self) -> List[ConferenceEvent]:
+        # Runs on the executor: let queued writes land before reading the file back.
+        self._flush_saves()
+        return load_conferences()
+
+    # -------------------------------------------------------------------------
+    # Persistence (background writer)
+    # -------------------------------------------------------------------------
+    def _request_save(self) -> None:
+        """Queue the current list for saving; a newer request replaces a pending one."""
+        if not self._loaded:
+            # Saving before the stored list arrives would overwrite it.
+            self._save_after_load = True
+            return
+        if self._load_after_id is not None:
+            self._edited_during_reload = True
+        snapshot = [copy.copy(c) for c in self.conferences]
+        while True:
+            try:
+                self._save_queue.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self._save_queue.get_nowait()
+                    self._save_queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def _save_worker(self) -> None:
+        while True:
+            item = self._save_queue.get()
+            if item is _SAVE_STOP:
+                self._save_queue.task_done()
+                return
+            # Short quiet period so a burst of edits ends up as one write.
+            time.sleep(SAVE_COALESCE_S)
+            stop = False
+            try:
+                while True:
+                    newer = self._save_queue.get_nowait()
+                    self._save_queue.task_done()
+                    if newer is _SAVE_STOP:
+                        stop = True
+                        break
+                    item = newer
+            except queue.Empty:
+                pass
+            try:
+                save_conferences(item)
+            except Exception as exc:
+                # Once destroy() is waiting on this thread the UI cannot show anything.
+                if not self._closing:
+                    err = str(exc)
+                    self._post_to_ui(lambda: messagebox.showerror("保存失败", f"会议列表保存失败，最近的修改未写入磁盘：\n{err}"))
+            finally:
+                self._save_queue.task_done()
+            if stop:
+                return
+
+    def _flush_saves(self) -> None:
+        """Block until every queued save has been written."""
+        self._save_queue.join()
+
+    def destroy(self) -> None:
+        for after_id in (self._after_id, self._refresh_after_id, self._load_after_id):
+            if after_id:
+                try:
+                    self.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._after_id = self._refresh_after_id = self._load_after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._save_thread.is_alive():
+            self._closing = True
+            self._save_queue.put(_SAVE_STOP)
+            self._save_thread.join(timeout=5)
+        super().destroy()
 
     # -------------------------------------------------------------------------
     # Auto refresh
@@ -665,14 +1027,29 @@ class ConferencesFrame(ctk.CTkFrame):
                 pass
             self._after_id = None
 
+        self._next_auto_tick = time.monotonic() + self._auto_refresh_interval_s()
+        self._arm_auto_tick()
+
+    def _auto_refresh_interval_s(self) -> int:
         mins = _try_int(self.refresh_min_var.get(), 60)
-        mins = _clamp_int(mins, 1, 12 * 60)
-        ms = mins * 60 * 1000
-        self._after_id = self.after(ms, self._auto_tick)
+        return _clamp_int(mins, 1, 12 * 60) * 60
+
+    def _arm_auto_tick(self) -> None:
+        delay_ms = max(0, int((self._next_auto_tick - time.monotonic()) * 1000))
+        self._after_id = self.after(delay_ms, self._auto_tick)
 
     def _auto_tick(self) -> None:
+        self._after_id = None
+        if not self.winfo_exists():
+            return
         self.manual_refresh()
-        self._schedule_auto_refresh()
+        # Step from the previous due time so the period does not drift; after a
+        # long stall (e.g. suspend) restart from now rather than firing a burst.
+        now = time.monotonic()
+        self._next_auto_tick += self._auto_refresh_interval_s()
+        if self._next_auto_tick <= now:
+            self._next_auto_tick = now + self._auto_refresh_interval_s()
+        self._arm_auto_tick()
 
     # -------------------------------------------------------------------------
     # Reminder System
@@ -681,10 +1058,13 @@ class ConferencesFrame(ctk.CTkFrame):
         days = _try_int(self.window_days_var.get(), 7)
         days = _clamp_int(days, 1, 365)
         self.window_days_var.set(str(days))
+        if self.config.conference_window_days == days:
+            # 未变化则不重写 config.json
+            return
 
         # 写回 config（你原本就从 config 读了 conference_window_days）
         try:
-            setattr(self.config, "conference_window_days", days)
+            self.config.conference_window_days = days
             self.on_config_update(self.config)
         except Exception:
             pass
@@ -700,21 +1080,20 @@ class ConferencesFrame(ctk.CTkFrame):
         days = _try_int(self.window_days_var.get(), 7)
         include_overdue = bool(self.include_overdue_var.get())
 
-        matches: List[ConferenceEvent] = []
-        for c in self.conferences:
-            try:
-                if c.is_due_within(days) or (include_overdue and c.is_overdue()):
-                    matches.append(c)
-            except Exception:
-                # 如果日期不可解析，不参与自动匹配
-                continue
+        today = date.today()
+        keys, by_deadline = self._deadlines_sorted()
+        lo = 0 if include_overdue else bisect.bisect_left(keys, today)
+        hi = bisect.bisect_right(keys, today + timedelta(days=days))
+        matches = by_deadline[lo:hi]
 
         targets = self.get_checked_targets()
         self._open_send_dialog(matches, targets, "自动提醒预览")
 
     def _open_send_dialog(self, confs: Sequence[ConferenceEvent], targets: Sequence[Any], title: str) -> None:
-        all_t = list(getattr(self.config, "lan_targets", []) or [])
-        sel_t_idxs = {i for i, t in enumerate(all_t) if t in targets}
+        all_t = self.config.lan_targets
+        # Targets are the config's own objects, so identity is an O(1) match.
+        chosen = {id(t) for t in targets}
+        sel_t_idxs = {i for i, t in enumerate(all_t) if id(t) in chosen}
         sel_c_ids = {c.id for c in confs}
 
         dlg = SendConfirmDialog(self, self.conferences, all_t, sel_c_ids, sel_t_idxs, title)
@@ -730,6 +1109,12 @@ class ConferencesFrame(ctk.CTkFrame):
         try:
             self.btn_auto_send.configure(state=state)
             self.btn_manual_send.configure(state=state)
+            if sending:
+                self.send_progress.pack(fill="x", pady=(6, 0))
+                self.send_progress.start()
+            else:
+                self.send_progress.stop()
+                self.send_progress.pack_forget()
         except Exception:
             pass
 
@@ -744,7 +1129,7 @@ class ConferencesFrame(ctk.CTkFrame):
             messagebox.showinfo("提示", "正在发送中，请稍后再试。")
             return
 
-        msg = "会议提醒:\n" + "\n".join([f"- {c.name} (截止: {c.submission_deadline})" for c in confs])
+        msg = self._MSG_HEADER + "\n".join(f"- {c.name} (截止: {c.submission_deadline})" for c in confs)
 
         self._set_sending_state(True)
 
@@ -761,36 +1146,44 @@ class ConferencesFrame(ctk.CTkFrame):
                     smtp_use_tls=getattr(self.config, "smtp_use_tls", True),
                 )
             except Exception as e:
-                res = None
                 err = str(e)
+                self._post_to_ui(lambda: self._show_send_error(err))
+                return
 
-                def ui_fail():
-                    self._set_sending_state(False)
-                    messagebox.showerror("发送失败", f"发送过程中发生异常：\n{err}")
+            self._post_to_ui(lambda: self._show_send_result(res, targets))
 
-                self.after(0, ui_fail)
-                return
+        # A daemon thread, so closing the app never waits on a slow SMTP server.
+        threading.Thread(target=worker, daemon=True).start()
 
-            def ui_done():
-                self._set_sending_state(False)
-                if not res:
-                    messagebox.showerror("发送失败", "未获得发送结果（可能发送模块返回空）。")
-                    return
+    def _post_to_ui(self, callback: Callable[[], None]) -> None:
+        """Schedule *callback* on the Tk thread unless the frame is gone."""
+        try:
+            self.after(0, lambda: self.winfo_exists() and callback())
+        except (RuntimeError, tk.TclError):
+            # Interpreter or widget already destroyed while the worker ran.
+            pass
 
-                ok = sum(1 for r in res if r[1])
-                fail_msg = "\n".join([f"{getattr(r[0], 'label', 'Unknown')}: {r[2]}" for r in res if not r[1]])
+    def _show_send_error(self, err: str) -> None:
+        self._set_sending_state(False)
+        messagebox.showerror("发送失败", f"发送过程中发生异常：\n{err}")
 
-                if ok == len(list(targets)):
-                    messagebox.showinfo("发送成功", f"全部 {ok} 条发送成功！")
-                else:
-                    messagebox.showerror(
-                        "部分失败",
-                        f"成功: {ok}\n失败: {len(list(targets)) - ok}\n\n错误详情:\n{fail_msg}",
-                    )
+    def _show_send_result(self, res: Optional[List[Tuple[Any, bool, str]]], targets: Sequence[Any]) -> None:
+        self._set_sending_state(False)
+        if not res:
+            messagebox.showerror("发送失败", "未获得发送结果（可能发送模块返回空）。")
+            return
 
-            self.after(0, ui_done)
+        n_targets = len(targets)
+        ok = sum(r[1] for r in res)
+        if ok == n_targets:
+            messagebox.showinfo("发送成功", f"全部 {ok} 条发送成功！")
+            return
 
-        threading.Thread(target=worker, daemon=True).start()
+        fail_msg = "\n".join(f"{r[0].label}: {r[2]}" for r in res if not r[1])
+        messagebox.showerror(
+            "部分失败",
+            f"成功: {ok}\n失败: {n_targets - ok}\n\n错误详情:\n{fail_msg}",
+        )
 
     def _open_email_settings(self) -> None:
         EmailSettingsDialog(self, self.config, lambda c: self.on_config_update(c))
@@ -824,53 +1217,68 @@ class AddConferenceDialog(ctk.CTkToplevel):
         grid_opts = {"sticky": "ew", "pady": 8}
         f.columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(f, text="会议名称 *").grid(row=0, column=0, sticky="w")
-        ctk.CTkEntry(f, textvariable=self.name_var).grid(row=0, column=1, **grid_opts)
-
-        ctk.CTkLabel(f, text="等级").grid(row=1, column=0, sticky="w")
-        ctk.CTkComboBox(f, variable=self.cat_var, values=["CCF-A", "CCF-B", "CCF-C"]).grid(row=1, column=1, **grid_opts)
-
-        ctk.CTkLabel(f, text="截止日期 * (YYYY-MM-DD)").grid(row=2, column=0, sticky="w")
-        ctk.CTkEntry(f, textvariable=self.date_var).grid(row=2, column=1, **grid_opts)
-
-        ctk.CTkLabel(f, text="地点/备注").grid(row=3, column=0, sticky="w")
-        ctk.CTkEntry(f, textvariable=self.loc_var).grid(row=3, column=1, **grid_opts)
-
-        ctk.CTkLabel(f, text="URL").grid(row=4, column=0, sticky="w")
-        ctk.CTkEntry(f, textvariable=self.url_var).grid(row=4, column=1, **grid_opts)
-
-        ctk.CTkLabel(f, text="提前提醒(天)").grid(row=5, column=0, sticky="w")
-        ctk.CTkEntry(f, textvariable=self.remind_var).grid(row=5, column=1, **grid_opts)
+        fields = (
+            ("会议名称 *", self.name_var),
+            ("等级", self.cat_var),
+            ("截止日期 * (YYYY-MM-DD)", self.date_var),
+            ("地点/备注", self.loc_var),
+            ("URL", self.url_var),
+            ("提前提醒(天)", self.remind_var),
+        )
+        for row, (label, var) in enumerate(fields):
+            ctk.CTkLabel(f, text=label).grid(row=row, column=0, sticky="w")
+            if var is self.cat_var:
+                field = ctk.CTkComboBox(f, variable=var, values=["CCF-A", "CCF-B", "CCF-C"])
+            else:
+                field = ctk.CTkEntry(f, textvariable=var)
+            field.grid(row=row, column=1, **grid_opts)
 
         btn_row = ctk.CTkFrame(f, fg_color="transparent")
-        btn_row.grid(row=6, column=0, columnspan=2, pady=(20, 0), sticky="e")
+        btn_row.grid(row=len(fields), column=0, columnspan=2, pady=(20, 0), sticky="e")
 
         ctk.CTkButton(btn_row, text="取消", width=80, fg_color="transparent", border_width=1, command=self.destroy).pack(side="right", padx=8)
         ctk.CTkButton(btn_row, text="保存", width=80, command=self._save).pack(side="right")
 
-    def _save(self):
+    def _read_form(self) -> Optional[Dict[str, Any]]:
+        """
+        Read and validate the form in one pass.
+        Returns ConferenceEvent field values (remind_before_days is None if not
+        a number), or None after showing an error.
+        """
         name = self.name_var.get().strip()
         date_str = self.date_var.get().strip()
-
         if not name or not date_str:
             messagebox.showerror("错误", "名称和截止日期必填")
-            return
+            return None
 
         try:
             date_norm = _parse_date_yyyy_mm_dd(date_str)
         except Exception:
             messagebox.showerror("错误", "截止日期格式必须为 YYYY-MM-DD（例如 2026-01-15）")
-            return
+            return None
 
-        c = ConferenceEvent(name=name, category=self.cat_var.get(), submission_deadline=date_norm)
-        c.location = self.loc_var.get()
-        c.url = self.url_var.get()
         try:
-            c.remind_before_days = int(self.remind_var.get())
+            remind: Optional[int] = int(self.remind_var.get())
         except Exception:
-            c.remind_before_days = 7
+            remind = None
+
+        return {
+            "name": name,
+            "category": self.cat_var.get(),
+            "submission_deadline": date_norm,
+            "location": self.loc_var.get(),
+            "url": self.url_var.get(),
+            "remind_before_days": remind,
+        }
 
-        self.on_save(c)
+    def _save(self):
+        fields = self._read_form()
+        if fields is None:
+            return
+        if fields["remind_before_days"] is None:
+            fields["remind_before_days"] = 7
+
+        self.on_save(ConferenceEvent(**fields))
         self.destroy()
 
 
@@ -885,36 +1293,24 @@ class EditConferenceDialog(AddConferenceDialog):
         self.name_var = tk.StringVar(value=conf.name)
         self.cat_var = tk.StringVar(value=conf.category)
         self.date_var = tk.StringVar(value=conf.submission_deadline)
-        self.loc_var = tk.StringVar(value=getattr(conf, "location", ""))
-        self.url_var = tk.StringVar(value=getattr(conf, "url", ""))
-        self.remind_var = tk.StringVar(value=str(getattr(conf, "remind_before_days", 7)))
+        self.loc_var = tk.StringVar(value=conf.location)
+        self.url_var = tk.StringVar(value=conf.url)
+        self.remind_var = tk.StringVar(value=str(conf.remind_before_days))
 
         self._build()
         self.transient(master)
         self.grab_set()
 
     def _save(self):
-        name = self.name_var.get().strip()
-        date_str = self.date_var.get().strip()
-        if not name or not date_str:
-            messagebox.showerror("错误", "名称和截止日期必填")
+        fields = self._read_form()
+        if fields is None:
             return
+        if fields["remind_before_days"] is None:
+            # 非数字则保留原值
+            del fields["remind_before_days"]
 
-        try:
-            date_norm = _parse_date_yyyy_mm_dd(date_str)
-        except Exception:
-            messagebox.showerror("错误", "截止日期格式必须为 YYYY-MM-DD（例如 2026-01-15）")
-            return
-
-        self.conf.name = name
-        self.conf.category = self.cat_var.get()
-        self.conf.submission_deadline = date_norm
-        self.conf.location = self.loc_var.get()
-        self.conf.url = self.url_var.get()
-        try:
-            self.conf.remind_before_days = int(self.remind_var.get())
-        except Exception:
-            pass
+        for key, value in fields.items():
+            setattr(self.conf, key, value)
 
         self.final_cb()
         self.destroy()
@@ -927,6 +1323,11 @@ class SendConfirmDialog(ctk.CTkToplevel):
         self.result = None
         self.all_confs = list(all_confs)
         self.all_targets = list(all_targets)
+        # Checked iids per tree; the check column only mirrors these sets. Built
+        # from the selections, so callers may pass any iterable of indices / ids.
+        n_targets = len(self.all_targets)
+        self._checked_t: Set[str] = {str(i) for i in sel_t_idxs if 0 <= i < n_targets}
+        self._checked_c: Set[str] = set(sel_c_ids).intersection(c.id for c in self.all_confs)
 
         self.geometry("920x580")
         self.minsize(880, 540)
@@ -942,17 +1343,18 @@ class SendConfirmDialog(ctk.CTkToplevel):
         left.columnconfigure(0, weight=1)
 
         ctk.CTkLabel(left, text="发送给谁？", font=("Arial", 14, "bold")).grid(row=0, column=0, sticky="w", padx=12, pady=(12, 6))
-        self.tree_t = self._create_check_tree(left, headers=["姓名", "邮箱"], widths=[130, 260], stretch_cols=[1])
-        self.tree_t.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 8))
+        box_t, self.tree_t = self._create_check_tree(left, headers=["姓名", "邮箱"], widths=[130, 260], stretch_cols=[1], checked=self._checked_t)
+        box_t.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 8))
 
+        insert, checked = self.tree_t.insert, self._checked_t
         for i, t in enumerate(self.all_targets):
-            ck = CHECK_ON if i in sel_t_idxs else CHECK_OFF
-            self.tree_t.insert("", tk.END, iid=str(i), values=(ck, getattr(t, "label", ""), getattr(t, "email", "")))
+            iid = str(i)
+            insert("", tk.END, iid=iid, values=(CHECK_ON if iid in checked else CHECK_OFF,) + _format_lan_target(t.label, t.email))
 
         t_btn = ctk.CTkFrame(left, fg_color="transparent")
         t_btn.grid(row=2, column=0, sticky="ew", padx=12, pady=(0, 12))
-        ctk.CTkButton(t_btn, text="全选", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_t, True)).pack(side="left", padx=(0, 8))
-        ctk.CTkButton(t_btn, text="清空", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_t, False)).pack(side="left")
+        ctk.CTkButton(t_btn, text="全选", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_t, self._checked_t, True)).pack(side="left", padx=(0, 8))
+        ctk.CTkButton(t_btn, text="清空", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_t, self._checked_t, False)).pack(side="left")
 
         # Right: conferences
         right = ctk.CTkFrame(self)
@@ -961,17 +1363,17 @@ class SendConfirmDialog(ctk.CTkToplevel):
         right.columnconfigure(0, weight=1)
 
         ctk.CTkLabel(right, text="发送哪些会议？", font=("Arial", 14, "bold")).grid(row=0, column=0, sticky="w", padx=12, pady=(12, 6))
-        self.tree_c = self._create_check_tree(right, headers=["会议", "截止"], widths=[520, 110], stretch_cols=[0])
-        self.tree_c.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 8))
+        box_c, self.tree_c = self._create_check_tree(right, headers=["会议", "截止"], widths=[520, 110], stretch_cols=[0], checked=self._checked_c)
+        box_c.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 8))
 
+        insert, checked = self.tree_c.insert, self._checked_c
         for c in self.all_confs:
-            ck = CHECK_ON if c.id in sel_c_ids else CHECK_OFF
-            self.tree_c.insert("", tk.END, iid=c.id, values=(ck, c.name, c.submission_deadline))
+            insert("", tk.END, iid=c.id, values=(CHECK_ON if c.id in checked else CHECK_OFF, c.name, c.submission_deadline))
 
         c_btn = ctk.CTkFrame(right, fg_color="transparent")
         c_btn.grid(row=2, column=0, sticky="ew", padx=12, pady=(0, 12))
-        ctk.CTkButton(c_btn, text="全选", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_c, True)).pack(side="left", padx=(0, 8))
-        ctk.CTkButton(c_btn, text="清空", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_c, False)).pack(side="left")
+        ctk.CTkButton(c_btn, text="全选", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_c, self._checked_c, True)).pack(side="left", padx=(0, 8))
+        ctk.CTkButton(c_btn, text="清空", width=70, fg_color="transparent", border_width=1, command=lambda: self._set_all(self.tree_c, self._checked_c, False)).pack(side="left")
 
         # Bottom buttons
         bottom = ctk.CTkFrame(self, fg_color="transparent")
@@ -979,7 +1381,15 @@ class SendConfirmDialog(ctk.CTkToplevel):
         ctk.CTkButton(bottom, text="取消", width=90, fg_color="transparent", border_width=1, command=self.destroy).pack(side="right", padx=(0, 10))
         ctk.CTkButton(bottom, text="确认发送", width=110, command=self._confirm).pack(side="right")
 
-    def _create_check_tree(self, parent: ctk.CTkFrame, headers: List[str], widths: List[int], stretch_cols: List[int]):
+    def _create_check_tree(
+        self,
+        parent: ctk.CTkFrame,
+        headers: List[str],
+        widths: List[int],
+        stretch_cols: List[int],
+        checked: Set[str],
+    ) -> Tuple[ctk.CTkFrame, ttk.Treeview]:
+        """Build a check-column Treeview with its scrollbar; returns (container to grid, tree)."""
         container = ctk.CTkFrame(parent, fg_color="transparent")
         container.rowconfigure(0, weight=1)
         container.columnconfigure(0, weight=1)
@@ -1005,17 +1415,10 @@ class SendConfirmDialog(ctk.CTkToplevel):
         tree.grid(row=0, column=0, sticky="nsew")
         ysb.grid(row=0, column=1, sticky="ns")
 
-        tree.bind("<Button-1>", lambda e: self._on_toggle(e, tree))
-        return container if isinstance(container, ttk.Widget) else container  # keep linter quiet
-
-    def _tree_from_container(self, container: ctk.CTkFrame) -> ttk.Treeview:
-        # container holds [Treeview, Scrollbar] as children; find the Treeview
-        for ch in container.winfo_children():
-            if isinstance(ch, ttk.Treeview):
-                return ch
-        raise RuntimeError("Treeview not found")
+        tree.bind("<Button-1>", lambda e: self._on_toggle(e, tree, checked))
+        return container, tree
 
-    def _on_toggle(self, event: tk.Event, tree: ttk.Treeview):
+    def _on_toggle(self, event: tk.Event, tree: ttk.Treeview, checked: Set[str]):
         region = tree.identify("region", event.x, event.y)
         if region != "cell":
             return
@@ -1024,37 +1427,27 @@ class SendConfirmDialog(ctk.CTkToplevel):
         item = tree.identify_row(event.y)
         if not item:
             return
-        vals = list(tree.item(item, "values"))
-        vals[0] = CHECK_OFF if vals[0] == CHECK_ON else CHECK_ON
-        tree.item(item, values=vals)
-
-    def _set_all(self, container_or_tree, on: bool) -> None:
-        tree = container_or_tree if isinstance(container_or_tree, ttk.Treeview) else self._tree_from_container(container_or_tree)
+        if item in checked:
+            checked.discard(item)
+            tree.set(item, "check", CHECK_OFF)
+        else:
+            checked.add(item)
+            tree.set(item, "check", CHECK_ON)
+
+    def _set_all(self, tree: ttk.Treeview, checked: Set[str], on: bool) -> None:
+        items = tree.get_children()
+        checked.clear()
+        if on:
+            checked.update(items)
         flag = CHECK_ON if on else CHECK_OFF
-        for item in tree.get_children():
-            vals = list(tree.item(item, "values"))
-            vals[0] = flag
-            tree.item(item, values=vals)
+        for item in items:
+            tree.set(item, "check", flag)
 
     def _confirm(self):
-        tree_t = self._tree_from_container(self.tree_t) if not isinstance(self.tree_t, ttk.Treeview) else self.tree_t
-        tree_c = self._tree_from_container(self.tree_c) if not isinstance(self.tree_c, ttk.Treeview) else self.tree_c
-
-        fin_t = []
-        for item in tree_t.get_children():
-            vals = tree_t.item(item, "values")
-            if vals and vals[0] == CHECK_ON:
-                try:
-                    fin_t.append(self.all_targets[int(item)])
-                except Exception:
-                    pass
-
-        fin_c = []
-        map_c = {c.id: c for c in self.all_confs}
-        for item in tree_c.get_children():
-            vals = tree_c.item(item, "values")
-            if vals and vals[0] == CHECK_ON and item in map_c:
-                fin_c.append(map_c[item])
+        # Read the checked sets, in list order, without asking Tk for any row.
+        checked_t, checked_c = self._checked_t, self._checked_c
+        fin_t = [t for i, t in enumerate(self.all_targets) if str(i) in checked_t]
+        fin_c = [c for c in self.all_confs if c.id in checked_c]
 
         self.result = (fin_c, fin_t)
         self.destroy()
@@ -1127,8 +1520,8 @@ class EditTargetDialog(ctk.CTkToplevel):
         self.target = target_obj
         self.on_save = on_save
 
-        self.name_var = tk.StringVar(value=getattr(target_obj, "label", ""))
-        self.email_var = tk.StringVar(value=getattr(target_obj, "email", ""))
+        self.name_var = tk.StringVar(value=target_obj.label)
+        self.email_var = tk.StringVar(value=target_obj.email)
 
         f = ctk.CTkFrame(self, fg_color="transparent")
         f.pack(fill="both", expand=True, padx=20, pady=20)
@@ -3,11 +3,16 @@ from __future__ import annotations
 
 import socket
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 from typing import List, Tuple
 
 from .models import LanTarget
 
+# Upper bound on concurrent UDP/SMTP sends for one notification batch.
+MAX_SEND_WORKERS = 8
+
 
 def send_lan_notifications(
     message: str,
@@ -24,52 +29,132 @@ def send_lan_notifications(
     Returns a list of tuples (LanTarget, success, detail) describing the last
     attempted channel. If both UDP and email are configured, success reflects
     the AND result; details aggregate failures.
+
+    Targets are contacted concurrently, so total latency is bounded by the
+    slowest recipient rather than the sum of all round-trips. Results keep
+    the order of *targets*. Each worker keeps one SMTP session for all the
+    targets it handles, so the TLS handshake and login happen once per worker.
     """
 
-    results: List[Tuple[LanTarget, bool, str]] = []
     if not targets:
-        return results
+        return []
+
+    sessions = _SmtpSessions(smtp_host, smtp_port, smtp_username, smtp_password, smtp_use_tls)
+
+    def send_one(target: LanTarget) -> Tuple[LanTarget, bool, str]:
+        return _send_to_target(message, target, smtp_sender, sessions)
+
+    try:
+        if len(targets) == 1:
+            return [send_one(targets[0])]
+
+        workers = min(MAX_SEND_WORKERS, len(targets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="csh-send") as pool:
+            return list(pool.map(send_one, targets))
+    finally:
+        sessions.close_all()
 
-    for target in targets:
-        errors: List[str] = []
-        udp_ok = True
-        if target.port:
+
+class _SmtpSessions:
+    """Lazily opened SMTP connections, one per sending thread."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        use_tls: bool,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: List[smtplib.SMTP] = []
+
+    def get(self) -> smtplib.SMTP:
+        """Return this thread's connection, connecting and logging in on first use."""
+        server = getattr(self._local, "server", None)
+        if server is None:
+            server = smtplib.SMTP(host=self.host, port=self.port, timeout=8)
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-                    sock.settimeout(2.0)
-                    sock.sendto(message.encode("utf-8"), (target.host, int(target.port)))
-            except OSError as exc:
-                udp_ok = False
-                errors.append(f"udp:{exc}")
-
-        mail_ok = True
-        if target.email:
-            if not smtp_sender:
-                mail_ok = False
-                errors.append("email:missing sender")
-            else:
-                try:
-                    msg = EmailMessage()
-                    msg["From"] = smtp_sender
-                    msg["To"] = target.email
-                    msg["Subject"] = "CampusStudyHub 通知"
-                    msg.set_content(message)
-                    with smtplib.SMTP(host=smtp_host, port=smtp_port, timeout=8) as server:
-                        if smtp_use_tls:
-                            server.starttls()
-                        if smtp_username and smtp_password:
-                            server.login(smtp_username, smtp_password)
-                        server.send_message(msg)
-                except Exception as exc:  # pragma: no cover - best effort
-                    mail_ok = False
-                    errors.append(f"email:{exc}")
-
-        if not target.port and not target.email:
-            errors.append("no channel configured")
+                if self.use_tls:
+                    server.starttls()
+                if self.username and self.password:
+                    server.login(self.username, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._local.server = server
+            with self._lock:
+                self._open.append(server)
+        return server
+
+    def discard(self) -> None:
+        """Drop this thread's connection after an error so the next send reconnects."""
+        server = getattr(self._local, "server", None)
+        if server is None:
+            return
+        self._local.server = None
+        with self._lock:
+            self._open.remove(server)
+        server.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            servers, self._open = self._open, []
+        for server in servers:
+            try:
+                server.quit()
+            except Exception:  # pragma: no cover - best effort
+                server.close()
+
+
+def _send_to_target(
+    message: str,
+    target: LanTarget,
+    smtp_sender: str | None,
+    sessions: _SmtpSessions,
+) -> Tuple[LanTarget, bool, str]:
+    """Deliver *message* to one target over every configured channel."""
+
+    errors: List[str] = []
+    udp_ok = True
+    if target.port:
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.settimeout(2.0)
+                sock.sendto(message.encode("utf-8"), (target.host, int(target.port)))
+        except OSError as exc:
             udp_ok = False
+            errors.append(f"udp:{exc}")
+
+    mail_ok = True
+    if target.email:
+        if not smtp_sender:
             mail_ok = False
+            errors.append("email:missing sender")
+        else:
+            try:
+                msg = EmailMessage()
+                msg["From"] = smtp_sender
+                msg["To"] = target.email
+                msg["Subject"] = "CampusStudyHub 通知"
+                msg.set_content(message)
+                sessions.get().send_message(msg)
+            except Exception as exc:  # pragma: no cover - best effort
+                sessions.discard()
+                mail_ok = False
+                errors.append(f"email:{exc}")
+
+    if not target.port and not target.email:
+        errors.append("no channel configured")
+        udp_ok = False
+        mail_ok = False
 
-        success = udp_ok and mail_ok
-        detail = "ok" if success else ";".join(errors) or "unknown"
-        results.append((target, success, detail))
-    return results
+    success = udp_ok and mail_ok
+    detail = "ok" if success else ";".join(errors) or "unknown"
+    return (target, success, detail)
@@ -69,8 +69,14 @@ def format_datetime(ts: float) -> str:
     return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
 
 
-@dataclass
-class ConferenceEvent:
+class _DeadlineMemo:
+    """Slot for ConferenceEvent's parsed-deadline memo, kept out of its dataclass fields."""
+
+    __slots__ = ("_deadline_cache",)
+
+
+@dataclass(slots=True)
+class ConferenceEvent(_DeadlineMemo):
     """Represents a CCF-related conference deadline."""
 
     name: str
@@ -84,29 +90,54 @@ class ConferenceEvent:
     source: str = "local"
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
 
+    def __post_init__(self) -> None:
+        # (deadline string, parsed date) memo for deadline_date; not persisted.
+        self._deadline_cache = ("", None)
+
     def to_dict(self) -> dict:
         return asdict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> "ConferenceEvent":
-        return cls(**data)
+        event = cls(**data)
+        # Parse the deadline while loading rather than on the first refresh.
+        event._prime_deadline()
+        return event
+
+    @property
+    def deadline_date(self) -> Optional[date]:
+        """Parsed submission deadline, or None if it is not a valid ISO date.
+
+        Parsed once and reused until ``submission_deadline`` is reassigned.
+        """
+        source, parsed = self._deadline_cache
+        if source != self.submission_deadline:
+            parsed = self._prime_deadline()
+        return parsed
+
+    def _prime_deadline(self) -> Optional[date]:
+        """Parse ``submission_deadline`` into the memo and return the result."""
+        try:
+            parsed = date.fromisoformat(self.submission_deadline)
+        except (TypeError, ValueError):
+            parsed = None
+        self._deadline_cache = (self.submission_deadline, parsed)
+        return parsed
 
     def is_due_within(self, days: int) -> bool:
-        try:
-            due = date.fromisoformat(self.submission_deadline)
-        except ValueError:
+        due = self.deadline_date
+        if due is None:
             return False
         return 0 <= (due - date.today()).days <= days
 
     def is_overdue(self) -> bool:
-        try:
-            due = date.fromisoformat(self.submission_deadline)
-        except ValueError:
+        due = self.deadline_date
+        if due is None:
             return False
         return due < date.today()
 
 
-@dataclass
+@dataclass(slots=True)
 class LanTarget:
     """Represents a LAN notification recipient.
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import csv
 import json
+import os
 import shutil
+import threading
 from pathlib import Path
 from typing import List, Optional
 
@@ -181,9 +183,17 @@ def save_conferences(conferences: List[ConferenceEvent]) -> None:
 
     ensure_data_dir()
     serializable = [c.to_dict() for c in conferences]
-    with CONFERENCES_PATH.open("w", encoding="utf-8") as f:
-        json.dump(serializable, f, indent=2)
-
+    # Saves run on a background thread while other views read the file, so write
+    # a sibling file and rename it over the real one, as save_config does. The
+    # name is per thread so two concurrent writers cannot share a temp file.
+    tmp_path = CONFERENCES_PATH.with_suffix(f".json.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(serializable, f, indent=2)
+        os.replace(tmp_path, CONFERENCES_PATH)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 def load_bib_cache() -> dict:
     """Load cached DOI metadata for BibTeX generation."""